@@ -1,10 +1,8 @@
-import asyncio
-
 from . import server
 
 
-def main():
-    asyncio.run(server.main())
+def main() -> None:
+    server.main()
 
 
 __all__ = ["main", "server"]
@@ -5,11 +5,24 @@ Pydantic models for Riksbank data validation and documentation.
 from __future__ import annotations
 
 from datetime import date, datetime
+from typing import TYPE_CHECKING, Any, Literal
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, StrictFloat, StrictStr
 
+if TYPE_CHECKING:
+    from swemo_mcp.utils.arrays import ForecastArray
 
-class ForecastMetadata(BaseModel):
+
+class _FrozenModel(BaseModel):
+    """
+    Shared base: responses are read-only and tolerate new upstream fields.
+    Validators are built on first use, not at import.
+    """
+
+    model_config = ConfigDict(extra="ignore", frozen=True, defer_build=True)
+
+
+class ForecastMetadata(_FrozenModel):
     """
     Metadata for a forecast vintage.
     """
@@ -33,16 +46,21 @@ class ForecastMetadata(BaseModel):
     )
 
 
-class ForecastObservation(BaseModel):
+class ForecastObservation(_FrozenModel):
     """
     A single forecast observation with date and value.
+
+    ``dt`` and ``value`` are strict: a JSON number is required for the value
+    (integers become floats), and numeric strings such as ``"1.5"`` are
+    rejected rather than converted.
     """
 
-    dt: str = Field(
+    dt: StrictStr = Field(
         ..., description="Date of the forecasted observation in YYYY-MM-DD format"
     )
-    value: float = Field(
-        ..., description="Raw numeric value (either forecast or outcome)"
+    value: StrictFloat = Field(
+        ...,
+        description="Raw numeric value (either forecast or outcome); numeric strings are rejected",
     )
 
     forecast: float | None = Field(
@@ -54,7 +72,17 @@ class ForecastObservation(BaseModel):
     )
 
 
-class ForecastVintage(BaseModel):
+def observation_date_key(raw_obs: list[dict[str, Any]]) -> str:
+    """
+    Return the key holding the date in raw API observations.
+
+    The API uses "dt" but older payloads carried "date"; a payload sticks
+    to one schema, so the first row decides for the whole vintage.
+    """
+    return "date" if raw_obs and "dt" not in raw_obs[0] else "dt"
+
+
+class ForecastVintage(_FrozenModel):
     """
     A forecast vintage containing metadata and observations.
     """
@@ -62,8 +90,21 @@ class ForecastVintage(BaseModel):
     metadata: ForecastMetadata
     observations: list[ForecastObservation]
 
+    def to_array(
+        self, dtype: Literal["float64", "float32"] = "float64"
+    ) -> ForecastArray:
+        """
+        Return the observations as NumPy columns (requires the ``arrays`` extra).
 
-class ForecastSeries(BaseModel):
+        Pass ``dtype="float32"`` to halve memory where precision allows; see
+        :func:`swemo_mcp.utils.arrays.vintage_to_array`.
+        """
+        from swemo_mcp.utils.arrays import vintage_to_array
+
+        return vintage_to_array(self, dtype)
+
+
+class ForecastSeries(_FrozenModel):
     """
     A complete forecast series with its vintages.
     """
@@ -72,7 +113,7 @@ class ForecastSeries(BaseModel):
     vintages: list[ForecastVintage]
 
 
-class PolicyRound(BaseModel):
+class PolicyRound(_FrozenModel):
     """
     Information about a monetary policy round.
     """
@@ -82,9 +123,13 @@ class PolicyRound(BaseModel):
     iteration: int
 
 
-class SeriesInfo(BaseModel):
+class SeriesInfo(_FrozenModel):
     """
     Information about an economic data series.
+
+    ``decimals`` is the published precision.  Series with few decimals and
+    moderate magnitudes (rates, growth, gaps) are safe to hold as float32
+    via ``ForecastVintage.to_array(dtype="float32")``; large levels are not.
     """
 
     id: str
@@ -96,7 +141,7 @@ class SeriesInfo(BaseModel):
     note: str | None = None
 
 
-class MonetaryPolicyDataResponse(BaseModel):
+class MonetaryPolicyDataResponse(_FrozenModel):
     """
     Represents the response from the Monetary Policy Data endpoint main endpoint.
     """
@@ -105,7 +150,7 @@ class MonetaryPolicyDataResponse(BaseModel):
     vintages: list[ForecastVintage]
 
 
-class MonetaryPolicyDataRoundsResponse(BaseModel):
+class MonetaryPolicyDataRoundsResponse(_FrozenModel):
     """
     Represents the response from the Monetary Policy Data endpoint for rounds.
     """
@@ -113,7 +158,7 @@ class MonetaryPolicyDataRoundsResponse(BaseModel):
     rounds: list[PolicyRound]
 
 
-class MonetaryPolicyDataSeriesResponse(BaseModel):
+class MonetaryPolicyDataSeriesResponse(_FrozenModel):
     """
     Represents the response from the Monetary Policy Data endpoint for series.
     """
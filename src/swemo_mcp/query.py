@@ -8,7 +8,7 @@ class ForecastRequest(BaseModel):
 
     policy_round: str | None = Field(
         None,
-        pattern=r"^(\d{4}:\d|latest)$",
+        pattern=r"^(?:[0-9]{4}:[0-9]|latest)$",
         description="E.g. '2024:3' or 'latest'.  None ⇒ all vintages.",
     )
     include_realized: bool = False
@@ -2,13 +2,16 @@
 MCP Server for Riksbank policy data.
 """
 
+import asyncio
+import os
 import sys
 import traceback
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 from typing import Any, AsyncIterator
 
 from mcp.server import FastMCP
 
+from swemo_mcp.services.monetary_policy_api import aclose_client
 from swemo_mcp.tools.monetary_policy_tools import (
     get_cpi_data,
     get_cpi_index_data,
@@ -18,6 +21,7 @@ from swemo_mcp.tools.monetary_policy_tools import (
     get_cpif_ex_energy_index_data,
     get_cpif_yoy_data,
     get_employed_persons_data,
+    get_forecasts,
     get_gdp_data,
     get_gdp_gap_data,
     get_gdp_level_ca_data,
@@ -39,42 +43,60 @@ from swemo_mcp.tools.monetary_policy_tools import (
     list_series_ids,
 )
 
+# Set SWEMO_MCP_DEBUG=1 to trace startup and shutdown on stderr
+_DEBUG = os.environ.get("SWEMO_MCP_DEBUG") == "1"
+
+
+def _log(msg: str) -> None:
+    """Write a status line to stderr (stdout carries the MCP stdio stream)."""
+    # Looked up per call so a redirected sys.stderr is honoured
+    sys.stderr.write(msg + "\n")
+
+
+def _debug(msg: str) -> None:
+    """Like :func:`_log`, but only when ``SWEMO_MCP_DEBUG`` is ``1``."""
+    if _DEBUG:
+        _log(msg)
+
+
+async def _warm_cache() -> None:
+    """Fill the request cache with the policy rounds and series catalogue."""
+    try:
+        await asyncio.gather(list_policy_rounds(), list_series_ids())
+    except Exception as e:
+        # Not fatal: the first tool call simply fetches them itself
+        _debug(f"[Swemo MCP Lifespan] Cache warm-up failed: {e}")
+    else:
+        _debug("[Swemo MCP Lifespan] Catalogue cache warmed.")
+
 
 @asynccontextmanager
 async def app_lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
-    print(
-        "[Riksbank Monetary Policy Data MCP Lifespan] Starting lifespan setup...",
-        file=sys.stderr,
-    )
+    _debug("[Riksbank Monetary Policy Data MCP Lifespan] Starting lifespan setup...")
 
-    # (Optional) Pre-fetch or initialize Riksbank-specific resources here.
+    # Warm the catalogue cache in the background: almost every tool call
+    # resolves the latest round, and startup should not wait on the network.
+    warmup = asyncio.create_task(_warm_cache())
     context_data: dict[str, Any] = {}  # Populate with any needed data
 
-    print(
-        "[Swemo MCP Lifespan] Initialization complete. All data cached.",
-        file=sys.stderr,
-    )
-    print("[Swemo MCP Lifespan] Yielding context...", file=sys.stderr)
+    _debug("[Swemo MCP Lifespan] Initialization complete; cache warm-up running.")
+    _debug("[Swemo MCP Lifespan] Yielding context...")
 
     try:
         yield context_data
-        print(
-            "[Swemo MCP Lifespan] Post-yield (server shutting down)...",
-            file=sys.stderr,
-        )
+        _debug("[Swemo MCP Lifespan] Post-yield (server shutting down)...")
     except Exception as e:
-        print(
-            f"[Swemo MCP Lifespan] Exception DURING yield/server run?: {e}",
-            file=sys.stderr,
-        )
+        _log(f"[Swemo MCP Lifespan] Exception DURING yield/server run?: {e}")
         traceback.print_exc(file=sys.stderr)
         raise
     finally:
-        print(
-            "[Swemo MCP Lifespan] Entering finally block (shutdown).",
-            file=sys.stderr,
-        )
-        print("[Swemo MCP] Shutting down.", file=sys.stderr)
+        _debug("[Swemo MCP Lifespan] Entering finally block (shutdown).")
+        # Let the warm-up unwind before its client goes away
+        warmup.cancel()
+        with suppress(asyncio.CancelledError):
+            await warmup
+        await aclose_client()
+        _debug("[Swemo MCP] Shutting down.")
 
 
 mcp = FastMCP(
@@ -84,52 +106,67 @@ mcp = FastMCP(
     lifespan=app_lifespan,
 )
 
-# Register Monetary Policy tools
-mcp.tool()(get_cpi_data)
-mcp.tool()(get_cpi_index_data)
-mcp.tool()(get_cpi_yoy_data)
-mcp.tool()(get_cpif_ex_energy_data)
-mcp.tool()(get_cpif_ex_energy_index_data)
-mcp.tool()(get_cpif_data)
-mcp.tool()(get_cpif_yoy_data)
-mcp.tool()(get_employed_persons_data)
-mcp.tool()(get_gdp_data)
-mcp.tool()(get_gdp_gap_data)
-mcp.tool()(get_gdp_level_ca_data)
-mcp.tool()(get_gdp_level_na_data)
-mcp.tool()(get_gdp_level_saca_data)
-mcp.tool()(get_gdp_yoy_na_data)
-mcp.tool()(get_gdp_yoy_sa_data)
-mcp.tool()(get_general_government_net_lending_data)
-mcp.tool()(get_hourly_labour_cost_data)
-mcp.tool()(get_hourly_wage_na_data)
-mcp.tool()(get_hourly_wage_nmo_data)
-mcp.tool()(get_labour_force_data)
-mcp.tool()(get_nominal_exchange_rate_kix_index_data)
-mcp.tool()(get_policy_rate_data)
-mcp.tool()(get_population_data)
-mcp.tool()(get_population_level_data)
-mcp.tool()(get_unemployment_data)
-mcp.tool()(list_series_ids)
-mcp.tool()(list_policy_rounds)
+# Monetary Policy tools, grouped: discovery, batch fetch, thematic series
+_TOOLS = (
+    list_policy_rounds,
+    list_series_ids,
+    get_forecasts,
+    get_cpi_data,
+    get_cpi_index_data,
+    get_cpi_yoy_data,
+    get_cpif_ex_energy_data,
+    get_cpif_ex_energy_index_data,
+    get_cpif_data,
+    get_cpif_yoy_data,
+    get_employed_persons_data,
+    get_gdp_data,
+    get_gdp_gap_data,
+    get_gdp_level_ca_data,
+    get_gdp_level_na_data,
+    get_gdp_level_saca_data,
+    get_gdp_yoy_na_data,
+    get_gdp_yoy_sa_data,
+    get_general_government_net_lending_data,
+    get_hourly_labour_cost_data,
+    get_hourly_wage_na_data,
+    get_hourly_wage_nmo_data,
+    get_labour_force_data,
+    get_nominal_exchange_rate_kix_index_data,
+    get_policy_rate_data,
+    get_population_data,
+    get_population_level_data,
+    get_unemployment_data,
+)
+
+for _tool in _TOOLS:
+    mcp.tool()(_tool)
+
+
+def _run_stdio() -> None:
+    """Serve over stdio, on libuv's event loop when uvloop is installed."""
+    try:
+        import uvloop  # type: ignore[import-not-found]
+    except ImportError:
+        mcp.run("stdio")
+    else:
+        # Same as mcp.run("stdio") but without installing a global loop
+        # policy, which is deprecated from Python 3.14
+        uvloop.run(mcp.run_stdio_async())
 
 
 def main() -> None:
     """
     Main entry point for Riksbank Monetary Policy Data MCP server.
     """
-    import sys
-    import traceback
-
-    print("[Swemo MCP] Starting server on stdio...", file=sys.stderr)
+    _debug("[Swemo MCP] Starting server on stdio...")
     try:
-        mcp.run("stdio")
-        print("[Swemo MCP] Finished cleanly.", file=sys.stderr)
+        _run_stdio()
+        _debug("[Swemo MCP] Finished cleanly.")
     except Exception as e:
-        print(f"[Swemo MCP] EXCEPTION: {e}", file=sys.stderr)
+        _log(f"[Swemo MCP] EXCEPTION: {e}")
         traceback.print_exc(file=sys.stderr)
     finally:
-        print("[Swemo MCP] Exiting.", file=sys.stderr)
+        _debug("[Swemo MCP] Exiting.")
 
 
 if __name__ == "__main__":
@@ -0,0 +1,172 @@
+"""
+Shared HTTP helpers for the Riksbank service modules.
+"""
+
+import asyncio
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any, Awaitable, Callable
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+CacheKey = tuple[str, str, tuple[tuple[str, Any], ...]]
+
+# Performs the request given the ETag of the stale entry (if any); returns
+# (payload, ETag), with payload None when the server answered 304.
+Fetch = Callable[[str | None], Awaitable[tuple[dict[str, Any] | None, str | None]]]
+
+# key → (expiry as time.monotonic() timestamp, decoded JSON payload, ETag)
+_cache: dict[CacheKey, tuple[float, dict[str, Any], str | None]] = {}
+_locks: dict[CacheKey, asyncio.Lock] = {}
+# Event loop the locks belong to; they are dropped when it changes
+_locks_loop: asyncio.AbstractEventLoop | None = None
+
+# Where immutable payloads are persisted across restarts
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "swemo-mcp"
+)
+
+
+def cache_key(base_url: str, endpoint: str, params: dict[str, Any] | None) -> CacheKey:
+    """
+    Build a hashable cache key from a request's base URL, endpoint and params.
+    """
+    return (base_url, endpoint, tuple(sorted(params.items())) if params else ())
+
+
+async def cached_request(
+    base_url: str,
+    endpoint: str,
+    params: dict[str, Any] | None,
+    ttl: float,
+    fetch: Fetch,
+    persist: bool = False,
+) -> dict[str, Any]:
+    """
+    Return a cached JSON payload, calling *fetch* on a miss or after expiry.
+
+    Concurrent misses for the same key wait on a shared lock so that only
+    one request reaches the network; the lock is dropped once the miss is
+    resolved.  Callers must treat the returned
+    payload as read-only since it is shared between calls.
+
+    An expired entry is revalidated rather than dropped: its ETag is handed
+    to *fetch*, and if the server replies ``304 Not Modified`` the stale
+    payload – the very same object – is kept for another *ttl* seconds.
+
+    With *persist* the payload is also written to :data:`CACHE_DIR` and read
+    back on a cold start.  Only use it for responses that never change,
+    since the disk copy is not revalidated.  Payloads with an empty
+    ``data`` list are never persisted: an empty answer may only mean the
+    data is not published yet.
+
+    Args:
+        base_url: Base URL of the API, part of the cache key.
+        endpoint: The API endpoint, part of the cache key.
+        params: Query parameters, part of the cache key.
+        ttl: Time to live for the cached payload, in seconds.
+        fetch: Coroutine factory performing the real request, see ``Fetch``.
+        persist: Keep the payload on disk as well as in memory.
+
+    Returns:
+        The decoded JSON payload.
+    """
+    key = cache_key(base_url, endpoint, params)
+    entry = _cache.get(key)
+    if entry is not None and entry[0] > time.monotonic():
+        return entry[1]
+
+    lock = _lock_for(key)
+    try:
+        async with lock:
+            # Another caller may have filled the entry while we were waiting
+            entry = _cache.get(key)
+            if entry is not None and entry[0] > time.monotonic():
+                return entry[1]
+            if persist and entry is None:
+                stored = _read_disk(key)
+                if stored is not None:
+                    _cache[key] = (time.monotonic() + ttl, stored, None)
+                    return stored
+            logger.debug(f"Cache miss for {key}")
+            etag = entry[2] if entry is not None else None
+            payload, new_etag = await fetch(etag)
+            if payload is None:
+                assert entry is not None
+                logger.debug(f"Not modified: {key}")
+                payload, new_etag = entry[1], etag
+            elif persist and _has_data(payload):
+                _write_disk(key, payload)
+            _cache[key] = (time.monotonic() + ttl, payload, new_etag)
+            return payload
+    finally:
+        # The resolved entry now serves later callers from the fast path, and
+        # anyone already queued holds the lock object itself – so the table
+        # entry can go, keeping _locks as small as the set of pending misses.
+        if _locks.get(key) is lock:
+            del _locks[key]
+
+
+def _lock_for(key: CacheKey) -> asyncio.Lock:
+    """
+    Return the lock for *key*, starting afresh under a new event loop.
+
+    An ``asyncio.Lock`` is bound to the loop it is first contended on, so
+    locks left over from an earlier ``asyncio.run`` cannot be reused.
+    """
+    global _locks_loop
+    loop = asyncio.get_running_loop()
+    if _locks_loop is not loop:
+        _locks.clear()
+        _locks_loop = loop
+    return _locks.setdefault(key, asyncio.Lock())
+
+
+def _disk_path(key: CacheKey) -> Path:
+    digest = hashlib.sha256(repr(key).encode()).hexdigest()
+    return CACHE_DIR / f"{digest}.json"
+
+
+def _has_data(payload: dict[str, Any]) -> bool:
+    # Riksbank responses wrap their results in a "data" member
+    return bool(payload.get("data"))
+
+
+def _read_disk(key: CacheKey) -> dict[str, Any] | None:
+    try:
+        stored: dict[str, Any] = orjson.loads(_disk_path(key).read_bytes())
+    except FileNotFoundError:
+        return None
+    except (OSError, orjson.JSONDecodeError) as e:
+        logger.warning(f"Ignoring unreadable disk cache entry for {key}: {e}")
+        return None
+    # Empty entries are never written now, but older versions did
+    return stored if _has_data(stored) else None
+
+
+def _write_disk(key: CacheKey, payload: dict[str, Any]) -> None:
+    path = _disk_path(key)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write-then-rename so a concurrent reader never sees half a file
+        tmp = path.with_suffix(".tmp")
+        tmp.write_bytes(orjson.dumps(payload))
+        tmp.replace(path)
+    except OSError as e:
+        logger.warning(f"Could not write disk cache entry for {key}: {e}")
+
+
+def clear_cache(disk: bool = False) -> None:
+    """
+    Drop every cached payload, and with *disk* the persisted ones too.
+    """
+    _cache.clear()
+    _locks.clear()
+    if disk:
+        for path in CACHE_DIR.glob("*.json"):
+            path.unlink(missing_ok=True)
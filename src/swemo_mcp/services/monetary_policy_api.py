@@ -4,10 +4,16 @@ Monetary Policy API helper functions for interacting with the Riksbank's Monetar
 
 import asyncio
 import logging
-from typing import Any
+import math
+from contextlib import suppress
+from functools import lru_cache
+from typing import Any, Literal
 from urllib.parse import urlencode
 
 import httpx
+import orjson
+
+from swemo_mcp.services._http import cached_request
 
 # Set up logging
 logger = logging.getLogger(__name__)
@@ -16,10 +22,100 @@ logger = logging.getLogger(__name__)
 BASE_URL = "https://api.riksbank.se/monetary_policy_data/v1/forecasts"
 
 
+# Longest server-requested pause (seconds) honoured before retrying a 429
+MAX_RETRY_AFTER = 60.0
+
+# Endpoints served under BASE_URL; "" is the forecasts resource itself
+Endpoint = Literal["", "policy_rounds", "series_ids"]
+
+_URLS: dict[str, str] = {
+    "": BASE_URL,
+    "policy_rounds": f"{BASE_URL}/policy_rounds",
+    "series_ids": f"{BASE_URL}/series_ids",
+}
+
+
+# Shared client – created lazily on first use and closed by the server lifespan
+_client: httpx.AsyncClient | None = None
+# Event loop the client's connections belong to
+_client_loop: asyncio.AbstractEventLoop | None = None
+# Task on that loop which closes the client when the loop shuts down
+_client_closer: "asyncio.Task[None] | None" = None
+
+
+def get_client() -> httpx.AsyncClient:
+    """
+    Return the process-wide HTTP client, creating it on first use.
+
+    Reusing one pooled client keeps TLS sessions warm across tool calls and
+    lets concurrent requests multiplex over HTTP/2.  The transport retries
+    failed connection attempts (DNS, TCP, TLS) itself, so a flaky network
+    does not surface as an error from the first request after idling.
+
+    Pooled connections cannot outlive their event loop, so a new client is
+    made whenever the running loop changes, e.g. across ``asyncio.run``
+    calls in library use.  Each client is closed on its own loop when that
+    loop shuts down, see :func:`_close_with_loop`.
+    """
+    global _client, _client_loop, _client_closer
+    loop = asyncio.get_running_loop()
+    if _client is None or _client.is_closed or _client_loop is not loop:
+        # Pool settings live on the transport; the client ignores them once
+        # an explicit transport is given.
+        transport = httpx.AsyncHTTPTransport(
+            retries=3,
+            http2=True,
+            # HTTP/2 multiplexes concurrent requests over one connection,
+            # so a handful of sockets is plenty; the cap still matches
+            # MAX_CONCURRENT_FETCHES should the server fall back to 1.1.
+            limits=httpx.Limits(
+                max_keepalive_connections=4,
+                max_connections=8,
+                keepalive_expiry=60.0,
+            ),
+        )
+        _client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(30.0),
+        )
+        _client_loop = loop
+        _client_closer = loop.create_task(_close_with_loop(_client))
+    return _client
+
+
+async def _close_with_loop(client: httpx.AsyncClient) -> None:
+    """
+    Wait until cancelled, then close *client*.
+
+    ``asyncio.run`` cancels leftover tasks before it closes the loop, so this
+    runs while the client's connections can still be shut down cleanly –
+    once the loop is closed they can no longer be.
+    """
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await client.aclose()
+
+
+async def aclose_client() -> None:
+    """
+    Close the shared HTTP client if it has been created.
+    """
+    global _client, _client_loop, _client_closer
+    closer = _client_closer
+    _client = _client_loop = _client_closer = None
+    if closer is not None and closer.get_loop() is asyncio.get_running_loop():
+        closer.cancel()
+        with suppress(asyncio.CancelledError):
+            await closer
+
+
 async def riksbanken_request(
-    endpoint: str = "",
+    endpoint: Endpoint = "",
     params: dict[str, Any] | None = None,
     retries: int = 5,
+    ttl: float | None = None,
+    persist: bool = False,
 ) -> dict[str, Any]:
     """
     Make a request to the Riksbank Monetary Policy API with automatic retries for 429 errors.
@@ -28,6 +124,10 @@ async def riksbanken_request(
         endpoint: The API endpoint to call
         params: Optional query parameters
         retries: Number of retries on a 429 error. Default is 5.
+        ttl: Seconds to cache the response in-process. ``None`` disables
+            caching. Cached payloads are shared and must not be mutated.
+        persist: Also keep the cached payload on disk across restarts.
+            Only for responses that never change; requires *ttl*.
 
     Returns:
         The JSON response from the API
@@ -35,31 +135,88 @@ async def riksbanken_request(
     Raises:
         HTTPStatusError if the request fails after all retries
     """
-    url = BASE_URL
-    if endpoint:
-        url = f"{BASE_URL}/{endpoint}"
-
-    params = params or {}
-    query_string = urlencode(params, safe=":")
-    full_url = f"{url}?{query_string}"
-
-    async with httpx.AsyncClient() as client:
-        for attempt in range(retries):
-            try:
-                logger.debug(f"Requesting: {full_url}")
-                response = await client.get(full_url)
-                response.raise_for_status()
-                return response.json() if response.content else {}
-            except httpx.HTTPStatusError as exc:
-                status = exc.response.status_code
-                if status == 404:
-                    logger.warning(f"Got 404 at {full_url}, returning empty.")
-                    return {}
-                if status == 429 and attempt < retries - 1:
-                    wait = 2**attempt
-                    logger.warning(f"Rate limited, retrying in {wait}s…")
-                    await asyncio.sleep(wait)
-                    continue
-                logger.error(f"Failed after {attempt+1} tries: {full_url}")
-                raise
-        raise RuntimeError(f"Max retries exceeded for {full_url}")
+    if ttl is not None:
+        return await cached_request(
+            BASE_URL,
+            endpoint,
+            params,
+            ttl,
+            lambda etag: _get(endpoint, params, retries, etag),
+            persist=persist,
+        )
+    payload, _ = await _get(endpoint, params, retries)
+    return payload or {}
+
+
+async def _get(
+    endpoint: Endpoint,
+    params: dict[str, Any] | None,
+    retries: int,
+    etag: str | None = None,
+) -> tuple[dict[str, Any] | None, str | None]:
+    """
+    Perform the GET behind :func:`riksbanken_request`.
+
+    When *etag* is given the request is conditional; a ``304 Not Modified``
+    reply comes back as ``(None, etag)`` without touching the body.
+
+    Returns:
+        The decoded JSON payload and the response's ETag, if any.
+    """
+    full_url = _full_url(endpoint, tuple(params.items())) if params else _URLS[endpoint]
+    headers = {"If-None-Match": etag} if etag else None
+
+    client = get_client()
+    for attempt in range(retries):
+        try:
+            logger.debug(f"Requesting: {full_url}")
+            response = await client.get(full_url, headers=headers)
+            logger.debug(f"{response.http_version} {response.status_code}")
+            if response.status_code == 304:
+                return None, etag
+            response.raise_for_status()
+            payload = orjson.loads(response.content) if response.content else {}
+            return payload, response.headers.get("ETag")
+        except httpx.HTTPStatusError as exc:
+            status = exc.response.status_code
+            if status == 404:
+                logger.warning(f"Got 404 at {full_url}, returning empty.")
+                return {}, None
+            if status == 429 and attempt < retries - 1:
+                wait = _retry_after(exc.response, default=2**attempt)
+                logger.warning(f"Rate limited, retrying in {wait}s…")
+                await asyncio.sleep(wait)
+                continue
+            logger.error(f"Failed after {attempt+1} tries: {full_url}")
+            raise
+    raise RuntimeError(f"Max retries exceeded for {full_url}")
+
+
+@lru_cache(maxsize=256)
+def _full_url(endpoint: Endpoint, params: tuple[tuple[str, Any], ...]) -> str:
+    """
+    Return the request URL for *endpoint* with *params* as its query string.
+
+    Policy round identifiers must reach the API with ':' unescaped, which
+    httpx's own params encoding does not allow – hence urlencode(safe=":").
+    Memoised because tool calls keep repeating the same few queries.
+    """
+    return f"{_URLS[endpoint]}?{urlencode(params, safe=':')}"
+
+
+def _retry_after(response: httpx.Response, default: float) -> float:
+    """
+    Seconds to wait before retrying a 429, as dictated by the server.
+
+    Honours a ``Retry-After`` header given in seconds, capped at
+    :data:`MAX_RETRY_AFTER` so one tool call cannot stall indefinitely, and
+    falls back to *default* when it is missing, not finite or given as an
+    HTTP date.
+    """
+    try:
+        wait = float(response.headers["Retry-After"])
+    except (KeyError, ValueError):
+        return default
+    if not math.isfinite(wait):
+        return default
+    return min(max(0.0, wait), MAX_RETRY_AFTER)
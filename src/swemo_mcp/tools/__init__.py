@@ -1 +1,3 @@
 # Tools package initialization
+from swemo_mcp.tools.monetary_policy_tools import *  # noqa: F401,F403
+from swemo_mcp.tools.monetary_policy_tools import __all__  # noqa: F401
@@ -3,45 +3,163 @@ Riksbank Monetary‑Policy API helper functions
 ===========================================
 """
 
+import asyncio
 import logging
+from collections import OrderedDict
+from collections.abc import Callable
 from datetime import date
-from typing import Any
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Any, Final, Literal
 
+from pydantic import TypeAdapter, ValidationError
 
-# ---------------------------------------------------------------------
-# Resolve the most recent policy‑round ID once – used by several helpers
-# ---------------------------------------------------------------------
-async def _latest_round_id() -> str | None:
-    """Return the newest 'YYYY:I' identifier or None if catalogue empty."""
-    rounds = await list_policy_rounds()
-    if not rounds.rounds:
-        return None
-    return max(rounds.rounds, key=lambda r: (r.year, r.iteration)).id
-
-
-from swemo_mcp.models import ForecastObservation  # NEW
 from swemo_mcp.models import (
+    ForecastMetadata,
+    ForecastObservation,
     ForecastVintage,
     MonetaryPolicyDataResponse,
     MonetaryPolicyDataRoundsResponse,
     MonetaryPolicyDataSeriesResponse,
     PolicyRound,
     SeriesInfo,
+    observation_date_key,
 )
 from swemo_mcp.query import ForecastRequest
+from swemo_mcp.services._http import clear_cache
 from swemo_mcp.services.monetary_policy_api import riksbanken_request
 from swemo_mcp.utils.realized_merge import SeriesFetcher, merge_realized
 
+if TYPE_CHECKING:
+    from swemo_mcp.utils.arrays import ForecastArray
+
 logger = logging.getLogger(__name__)
 
+# In-process cache lifetimes (seconds) for the Riksbank endpoints
+POLICY_ROUNDS_TTL = 24 * 60 * 60
+SERIES_IDS_TTL = 24 * 60 * 60
+FORECAST_TTL = 60 * 60
+# Forecasts for a round older than the latest one no longer change
+CLOSED_ROUND_TTL = 7 * 24 * 60 * 60
+
+# Upper bound on Riksbank requests a single batch call keeps in flight
+MAX_CONCURRENT_FETCHES = 8
+
+# Parsed forecast responses kept for reuse – the catalogue over a few rounds
+MAX_PARSED_FORECASTS = 64
+
+# Series identifiers behind the thematic wrappers
+GDP_SERIES_ID: Final[str] = "SEQGDPNAYCA"
+UNEMPLOYMENT_SERIES_ID: Final[str] = "SEQLABUEASA"
+CPI_SERIES_ID: Final[str] = "SEMCPINAYNA"
+CPIF_SERIES_ID: Final[str] = "SEMCPIFNAYNA"
+CPIF_EX_ENERGY_SERIES_ID: Final[str] = "SEMCPIFFEXYNA"
+HOURLY_LABOUR_COST_SERIES_ID: Final[str] = "SEACOMNAYCA"
+HOURLY_WAGE_NA_SERIES_ID: Final[str] = "SEAWAGNAYCA"
+HOURLY_WAGE_NMO_SERIES_ID: Final[str] = "SEAWAGKLYNA"
+POPULATION_SERIES_ID: Final[str] = "SEPOPYRCA"
+EMPLOYED_PERSONS_SERIES_ID: Final[str] = "SEQLABEPASA"
+LABOUR_FORCE_SERIES_ID: Final[str] = "SEQLABLFASA"
+GDP_GAP_SERIES_ID: Final[str] = "SEQGDPGAPYSA"
+POLICY_RATE_SERIES_ID: Final[str] = "SEQRATENAYNA"
+GENERAL_GOVERNMENT_NET_LENDING_SERIES_ID: Final[str] = "SEAPBSNAYNA"
+GDP_LEVEL_SACA_SERIES_ID: Final[str] = "SEQGDPNAASA"
+GDP_LEVEL_CA_SERIES_ID: Final[str] = "SEQGDPNAACA"
+GDP_LEVEL_NA_SERIES_ID: Final[str] = "SEQGDPNAANA"
+GDP_YOY_SA_SERIES_ID: Final[str] = "SEQGDPNAYSA"
+GDP_YOY_NA_SERIES_ID: Final[str] = "SEQGDPNAYNA"
+CPI_INDEX_SERIES_ID: Final[str] = "SEMCPINAANA"
+CPIF_EX_ENERGY_INDEX_SERIES_ID: Final[str] = "SEMCPIFFEXANA"
+KIX_INDEX_SERIES_ID: Final[str] = "SEQKIXNAANA"
+POPULATION_LEVEL_SERIES_ID: Final[str] = "SEQPOPNAANA"
+
+SERIES_IDS: Final[frozenset[str]] = frozenset(
+    {
+        GDP_SERIES_ID,
+        UNEMPLOYMENT_SERIES_ID,
+        CPI_SERIES_ID,
+        CPIF_SERIES_ID,
+        CPIF_EX_ENERGY_SERIES_ID,
+        HOURLY_LABOUR_COST_SERIES_ID,
+        HOURLY_WAGE_NA_SERIES_ID,
+        HOURLY_WAGE_NMO_SERIES_ID,
+        POPULATION_SERIES_ID,
+        EMPLOYED_PERSONS_SERIES_ID,
+        LABOUR_FORCE_SERIES_ID,
+        GDP_GAP_SERIES_ID,
+        POLICY_RATE_SERIES_ID,
+        GENERAL_GOVERNMENT_NET_LENDING_SERIES_ID,
+        GDP_LEVEL_SACA_SERIES_ID,
+        GDP_LEVEL_CA_SERIES_ID,
+        GDP_LEVEL_NA_SERIES_ID,
+        GDP_YOY_SA_SERIES_ID,
+        GDP_YOY_NA_SERIES_ID,
+        CPI_INDEX_SERIES_ID,
+        CPIF_EX_ENERGY_INDEX_SERIES_ID,
+        KIX_INDEX_SERIES_ID,
+        POPULATION_LEVEL_SERIES_ID,
+    }
+)
+
+# Headline panel fetched by get_forecasts when no series IDs are given
+_DEFAULT_SERIES: Final[tuple[str, ...]] = (
+    GDP_SERIES_ID,
+    UNEMPLOYMENT_SERIES_ID,
+    CPI_SERIES_ID,
+    CPIF_SERIES_ID,
+    CPIF_EX_ENERGY_SERIES_ID,
+    HOURLY_LABOUR_COST_SERIES_ID,
+    HOURLY_WAGE_NA_SERIES_ID,
+    HOURLY_WAGE_NMO_SERIES_ID,
+    KIX_INDEX_SERIES_ID,
+    POPULATION_SERIES_ID,
+    EMPLOYED_PERSONS_SERIES_ID,
+    LABOUR_FORCE_SERIES_ID,
+    GDP_GAP_SERIES_ID,
+    POLICY_RATE_SERIES_ID,
+)
+
+# Build observation and policy-round models without re-validating fields
+# this module has already parsed itself.  Flip to False to validate every
+# row, e.g. when checking a changed upstream schema.
+_TRUST_API = True
+
+# Built once so every call reuses the same list validators
+_OBSERVATIONS_ADAPTER = TypeAdapter(list[ForecastObservation])
+_POLICY_ROUNDS_ADAPTER = TypeAdapter(list[PolicyRound])
+_SERIES_INFO_ADAPTER = TypeAdapter(list[SeriesInfo])
+
+# (series_id, policy_round, _TRUST_API) → (raw payload, parsed response).
+# An entry is reused only while the request cache hands back the very same
+# payload; the least recently used is dropped beyond MAX_PARSED_FORECASTS.
+_parsed_forecasts: OrderedDict[
+    tuple[str, str | None, bool], tuple[dict[str, Any], MonetaryPolicyDataResponse]
+] = OrderedDict()
+
+# Order of the fields in the hashable rows handed to _build_series_info
+_SERIES_INFO_FIELDS = (
+    "id",
+    "decimals",
+    "start_date",
+    "description",
+    "source_agency",
+    "unit",
+    "note",
+)
+
 # ---------------------------------------------------------------------
 # One‑liner shown to every LLM so it knows how to pass the argument.
 # ---------------------------------------------------------------------
 
-___all__ = [
+__all__ = [
+    "SERIES_IDS",
     "list_policy_rounds",
     "list_series_ids",
     "get_policy_data",
+    "get_policy_arrays",
+    "get_forecasts",
+    "enumerate_catalog",
+    "clear_forecast_cache",
     "get_gdp_data",
     "get_unemployment_data",
     "get_cpi_data",
@@ -69,6 +187,18 @@ ___all__ = [
     "get_population_level_data",
 ]
 
+
+# ---------------------------------------------------------------------
+# Resolve the most recent policy‑round ID once – used by several helpers
+# ---------------------------------------------------------------------
+async def _latest_round_id() -> str | None:
+    """Return the newest 'YYYY:I' identifier or None if catalogue empty."""
+    rounds = await list_policy_rounds()
+    if not rounds.rounds:
+        return None
+    return max(rounds.rounds, key=lambda r: (r.year, r.iteration)).id
+
+
 # =============================================================================
 # ─────────────────────────── Helper / discovery calls ─────────────────────────
 # =============================================================================
@@ -98,24 +228,33 @@ async def list_policy_rounds() -> MonetaryPolicyDataRoundsResponse:
         A pydantic model encapsulating a list of :class:`PolicyRound`
         objects (``rounds.rounds``).
     """
-    payload: dict[str, Any] = await riksbanken_request("policy_rounds")
+    payload: dict[str, Any] = await riksbanken_request(
+        "policy_rounds", ttl=POLICY_ROUNDS_TTL
+    )
     identifiers: list[str] = payload.get("data", []) or []
+    return _build_policy_rounds(tuple(identifiers), _TRUST_API)
+
 
-    rounds: list[PolicyRound] = []
+@lru_cache(maxsize=4)
+def _build_policy_rounds(
+    identifiers: tuple[str, ...], trusted: bool
+) -> MonetaryPolicyDataRoundsResponse:
+    """Parse round identifiers; memoised so an unchanged catalogue is reused.
+
+    *trusted* is :data:`_TRUST_API`, passed in so that it is part of the
+    cache key and flipping the flag takes effect on the next call.
+    """
+    make_row: Any = PolicyRound.model_construct if trusted else dict
+    rows: list[Any] = []
     for ident in identifiers:
         try:
             year_str, iter_str = ident.split(":")
-            rounds.append(
-                PolicyRound(
-                    id=ident,
-                    year=int(year_str),
-                    iteration=int(iter_str),
-                )
-            )
+            rows.append(make_row(id=ident, year=int(year_str), iteration=int(iter_str)))
         except ValueError:
             logger.warning(f"Unexpected policy round format: {ident}")
 
-    return MonetaryPolicyDataRoundsResponse(rounds=rounds)
+    rounds = rows if trusted else _POLICY_ROUNDS_ADAPTER.validate_python(rows)
+    return MonetaryPolicyDataRoundsResponse.model_construct(rounds=rounds)
 
 
 async def list_series_ids() -> MonetaryPolicyDataSeriesResponse:
@@ -130,28 +269,47 @@ async def list_series_ids() -> MonetaryPolicyDataSeriesResponse:
         Contains a list of :class:`SeriesInfo`—see attributes ``id``,
         ``description``, and so on.
     """
-    payload: dict[str, Any] = await riksbanken_request("series_ids")
+    payload: dict[str, Any] = await riksbanken_request("series_ids", ttl=SERIES_IDS_TTL)
     entries: list[dict[str, Any]] = payload.get("data", []) or []
 
-    series_list: list[SeriesInfo] = []
-    for entry in entries:
-        meta = entry.get("metadata", {})
-        try:
-            series_list.append(
-                SeriesInfo(
-                    id=entry.get("series_id", ""),
-                    decimals=int(meta.get("decimals", 0)),
-                    start_date=meta.get("start_date", ""),
-                    description=meta.get("description", ""),
-                    source_agency=meta.get("source_agency", ""),
-                    unit=meta.get("unit", ""),
-                    note=meta.get("note", None),
-                )
-            )
-        except Exception as e:
-            logger.error(
-                f"Error parsing series metadata for {entry.get('series_id')}: {e}"
-            )
+    # Hashable snapshot of the fields we use, so the parsed catalogue can be
+    # memoised across calls.
+    key = tuple(
+        (
+            entry.get("series_id", ""),
+            meta.get("decimals", 0),
+            meta.get("start_date", ""),
+            meta.get("description", ""),
+            meta.get("source_agency", ""),
+            meta.get("unit", ""),
+            meta.get("note", None),
+        )
+        for entry in entries
+        for meta in (entry.get("metadata", {}),)
+    )
+    return _build_series_info(key)
+
+
+@lru_cache(maxsize=4)
+def _build_series_info(
+    entries: tuple[tuple[Any, ...], ...],
+) -> MonetaryPolicyDataSeriesResponse:
+    """Validate series metadata rows; memoised like :func:`_build_policy_rounds`."""
+    rows: list[dict[str, Any]] = [
+        dict(zip(_SERIES_INFO_FIELDS, entry)) for entry in entries
+    ]
+
+    try:
+        series_list = _SERIES_INFO_ADAPTER.validate_python(rows)
+    except ValidationError:
+        # Fall back to row-by-row validation so one bad entry is skipped
+        # rather than dropping the whole catalogue.
+        series_list = []
+        for row in rows:
+            try:
+                series_list.append(SeriesInfo.model_validate(row))
+            except ValidationError as e:
+                logger.error(f"Error parsing series metadata for {row['id']}: {e}")
 
     return MonetaryPolicyDataSeriesResponse(series=series_list)
 
@@ -162,7 +320,7 @@ async def list_series_ids() -> MonetaryPolicyDataSeriesResponse:
 
 
 async def get_policy_data(
-    series_id: str, policy_round: str | None = None
+    series_id: str, policy_round: str | None = None, *, strict: bool = False
 ) -> MonetaryPolicyDataResponse:
     """Low‑level fetcher for any *forecast* series.
 
@@ -175,6 +333,10 @@ async def get_policy_data(
         Optional filter such as ``"2024:3"``.  When supplied, only the
         vintages released in that round are returned; when ``None`` all
         vintages across rounds are included.
+    strict : bool, default ``False``
+        Reject identifiers outside :data:`SERIES_IDS` with ``ValueError``
+        instead of querying the API.  Off by default since the API also
+        serves series without a thematic wrapper here.
 
     Returns
     -------
@@ -184,14 +346,153 @@ async def get_policy_data(
         ``vintages``).
 
     """
+    if strict and series_id not in SERIES_IDS:
+        raise ValueError(f"Unknown series ID '{series_id}'")
+
+    policy_round, payload = await _fetch_policy_payload(series_id, policy_round)
+    key = (series_id, policy_round, _TRUST_API)
+    hit = _parsed_forecasts.get(key)
+    if hit is not None and hit[0] is payload:
+        _parsed_forecasts.move_to_end(key)
+        return hit[1]
+
+    response = _parse_policy_data(series_id, payload)
+    _parsed_forecasts[key] = (payload, response)
+    _parsed_forecasts.move_to_end(key)
+    if len(_parsed_forecasts) > MAX_PARSED_FORECASTS:
+        _parsed_forecasts.popitem(last=False)
+    return response
+
+
+async def get_policy_arrays(
+    series_id: str,
+    policy_round: str | None = None,
+    dtype: Literal["float64", "float32"] = "float64",
+) -> "list[ForecastArray]":
+    """Fetch a forecast series straight into NumPy columns, one per vintage.
+
+    Library helper, not an MCP tool: builds the arrays directly from the
+    raw payload without creating a :class:`ForecastObservation` per row.
+    Requires the ``arrays`` extra.
+    """
+    from swemo_mcp.utils.arrays import payload_to_arrays
+
+    _, payload = await _fetch_policy_payload(series_id, policy_round)
+    return payload_to_arrays(payload, dtype)
+
+
+async def _fetch_policy_payload(
+    series_id: str, policy_round: str | None
+) -> tuple[str | None, dict[str, Any]]:
+    """Return the resolved round and the (shared, read‑only) raw payload."""
     # Convert special keyword to actual round ID
     if policy_round == "latest":
         policy_round = await _latest_round_id()
-    params: dict[str, Any] = {"series": series_id}
-    if policy_round:
-        params["policy_round_name"] = policy_round
+    params: dict[str, Any] = (
+        {"series": series_id, "policy_round_name": policy_round}
+        if policy_round
+        else {"series": series_id}
+    )
+
+    closed = policy_round is not None and await _is_closed_round(policy_round)
+    ttl = CLOSED_ROUND_TTL if closed else FORECAST_TTL
+
+    payload: dict[str, Any] = await riksbanken_request(
+        "", params, ttl=ttl, persist=closed
+    )
+    return policy_round, payload
+
+
+async def _is_closed_round(policy_round: str) -> bool:
+    """
+    True if *policy_round* is in the catalogue and older than the latest round.
+
+    Only such a round is closed: its forecasts are final and can be kept on
+    disk across restarts.  Unknown rounds – typos, future rounds, or ones
+    published since the catalogue was cached – never qualify.  Neither
+    does any round while the catalogue cannot be fetched, so the forecasts
+    themselves stay reachable.
+    """
+    try:
+        rounds = (await list_policy_rounds()).rounds
+    except Exception as e:
+        logger.warning(f"Policy round catalogue unavailable: {e}")
+        return False
+    known = {r.id: (r.year, r.iteration) for r in rounds}
+    if policy_round not in known:
+        return False
+    return known[policy_round] < max(known.values())
+
 
-    payload: dict[str, Any] = await riksbanken_request("", params)
+def _validated_observation(**fields: Any) -> ForecastObservation:
+    return ForecastObservation.model_validate(fields)
+
+
+def _cutoff_iso(cutoff_str: str | None) -> str | None:
+    """
+    Return a vintage's forecast cut-off as a canonical ISO date string.
+
+    ``None`` when the cut-off is missing or malformed, in which case every
+    observation of the vintage counts as an outcome.
+    """
+    if not cutoff_str:
+        return None
+    try:
+        return date.fromisoformat(cutoff_str).isoformat()
+    except ValueError:
+        logger.warning(f"Malformed cutoff date '{cutoff_str}' in vintage.")
+        return None
+
+
+def _build_observations(
+    raw_obs: list[dict[str, Any]],
+    cutoff_iso: str | None,
+    intern_date: Callable[[str, str], str],
+) -> list[ForecastObservation]:
+    """
+    Split raw observations into forecasts and outcomes around *cutoff_iso*.
+
+    Observation dates are ISO 'YYYY-MM-DD' strings, which order the same as
+    the dates themselves, so they are compared against the cut-off as
+    strings instead of parsing every row.  A non-canonical date such as
+    '2024-1-5' is compared lexically as well rather than being skipped.
+    """
+    # Row-loop helpers bound to locals once rather than looked up per row
+    make_row: Any = ForecastObservation.model_construct if _TRUST_API else dict
+    check_row: Any = _validated_observation if _TRUST_API else dict
+    date_and_value = itemgetter(observation_date_key(raw_obs), "value")
+    rows: list[Any] = []
+    append_row = rows.append
+    for obs in raw_obs:
+        dt_str, value = date_and_value(obs)
+        is_fc = False
+        # Only rows that already have the declared types skip validation,
+        # so bad data fails here just as it would in merge_realized.
+        build = check_row
+        if dt_str.__class__ is str:
+            dt_str = intern_date(dt_str, dt_str)
+            is_fc = cutoff_iso is not None and dt_str > cutoff_iso
+            if value.__class__ is float:
+                build = make_row
+
+        # map into the new schema -------------------------------
+        append_row(
+            build(
+                dt=dt_str,
+                value=value,
+                forecast=value if is_fc else None,
+                observation=None if is_fc else value,
+            )
+        )
+
+    # Pydantic‑validate the whole list in one call unless trusted
+    return rows if _TRUST_API else _OBSERVATIONS_ADAPTER.validate_python(rows)
+
+
+def _parse_policy_data(
+    series_id: str, payload: dict[str, Any]
+) -> MonetaryPolicyDataResponse:
+    """Build the response model from a raw forecasts payload."""
     items: list[dict[str, Any]] = payload.get("data", []) or []
     if not items:
         return MonetaryPolicyDataResponse(external_id=series_id, vintages=[])
@@ -201,46 +502,30 @@ async def get_policy_data(
     if isinstance(raw_vintages, dict):
         raw_vintages = [raw_vintages]
 
+    # The payload may be shared with the request cache, so build fresh
+    # dicts rather than annotating it in place.
+    vintages_objs: list[ForecastVintage] = []
+    # Vintages repeat the same dates; keep one str object per distinct date
+    dates: dict[str, str] = {}
     for v in raw_vintages:
-        # Determine cut‑off date for this vintage
-        cutoff_str: str | None = v.get("metadata", {}).get(
-            "forecast_cutoff_date"
-        )  # type: ignore[index]
-        cutoff_dt: date | None = None
-        if cutoff_str:
-            try:
-                cutoff_dt = date.fromisoformat(cutoff_str)
-            except ValueError:
-                logger.warning(f"Malformed cutoff date '{cutoff_str}' in vintage.")
-
-        # Annotate each observation
-        for obs in v.get("observations", []):
-            dt_str: str | None = obs.get("dt") or obs.get("date")
-            is_fc = False
-            if cutoff_dt and dt_str:
-                try:
-                    is_fc = date.fromisoformat(dt_str) > cutoff_dt
-                except ValueError:
-                    logger.debug(f"Bad observation date '{dt_str}' ignored.")
-
-            # map into the new schema -------------------------------
-            obs["forecast"] = obs["value"] if is_fc else None
-            obs["observation"] = None if is_fc else obs["value"]
-
-        # -----------------------------------------------------------------
-        # Pydantic‑validate each observation individually
-        # -----------------------------------------------------------------
-        v["observations"] = [
-            ForecastObservation.model_validate(o)  # NEW
-            for o in v.get("observations", [])
-        ]
-
-    # Validate after enrichment
-    vintages_objs: list[ForecastVintage] = [
-        ForecastVintage.model_validate(v) for v in raw_vintages
-    ]
+        metadata: dict[str, Any] = v.get("metadata", {})
+        observations = _build_observations(
+            v.get("observations", []),
+            _cutoff_iso(metadata.get("forecast_cutoff_date")),
+            dates.setdefault,
+        )
+
+        # Only the metadata still needs validating (it parses the dates);
+        # the observations are already models, so skip the envelope pass.
+        vintages_objs.append(
+            ForecastVintage.model_construct(
+                metadata=ForecastMetadata.model_validate(metadata),
+                observations=observations,
+            )
+        )
 
-    return MonetaryPolicyDataResponse(
+    # Vintages are already validated – skip a second pass over them
+    return MonetaryPolicyDataResponse.model_construct(
         external_id=raw.get("external_id", series_id),
         vintages=vintages_objs,
     )
@@ -256,21 +541,111 @@ async def _fetch_series(
     # Handle keyword "latest" before hitting the API
     # --------------------------------------------------------------
     round_name = req.policy_round
+    latest_round = None
+    if round_name == "latest" or req.include_realized:
+        latest_round = await _latest_round_id()
     if round_name == "latest":
-        round_name = await _latest_round_id()
+        round_name = latest_round
 
-    base = await _fetcher(series_id, round_name)
+    if not (req.include_realized and latest_round and latest_round != round_name):
+        return await _fetcher(series_id, round_name)
 
-    if req.include_realized:
-        latest_round = await _latest_round_id()
-        if latest_round and latest_round != round_name:
-            latest = await _fetcher(series_id, latest_round)
-            if base.vintages and latest.vintages:
-                merged = merge_realized(base.vintages[0], latest.vintages[0])
-                base.vintages[0] = merged
+    # Both rounds are needed – fetch them concurrently
+    base, latest = await asyncio.gather(
+        _fetcher(series_id, round_name), _fetcher(series_id, latest_round)
+    )
+    if base.vintages and latest.vintages:
+        merged = merge_realized(base.vintages[0], latest.vintages[0])
+        # base may be a cached response – replace, don't mutate
+        base = base.model_copy(update={"vintages": [merged, *base.vintages[1:]]})
     return base
 
 
+async def get_forecasts(
+    series_ids: list[str] | None = None,
+    req: ForecastRequest | None = None,
+) -> dict[str, MonetaryPolicyDataResponse]:
+    """
+    Fetch **several** forecast series in one call, concurrently.
+
+    Use this instead of calling the single‑series tools one after another
+    when you need a panel of indicators (e.g. GDP, CPIF and the policy rate
+    for the same round).  Series IDs are listed by `list_series_ids`; omit
+    `series_ids` to get the headline panel (GDP, unemployment, CPI, CPIF,
+    wages, KIX, labour market, output gap and the policy rate).
+
+    Invoke the tool with the series IDs and one **JSON object**, e.g.:
+
+        {"series_ids": ["SEQGDPNAYCA", "SEMCPIFNAYNA"],
+         "req": {"policy_round": "2024:3", "include_realized": true}}
+
+    Returns a mapping from each series ID to its
+    :class:`MonetaryPolicyDataResponse`.  A series that fails to load is
+    logged and returned with no vintages rather than failing the batch.
+    """
+    ids = list(series_ids) if series_ids else list(_DEFAULT_SERIES)
+    request = req or ForecastRequest(policy_round=None)
+    # With include_realized each series fetches two rounds at once; halve
+    # the fan-out so the requests in flight still fit the connection pool.
+    per_series = 2 if request.include_realized else 1
+    sem = asyncio.Semaphore(MAX_CONCURRENT_FETCHES // per_series)
+
+    async def _one(series_id: str) -> MonetaryPolicyDataResponse:
+        async with sem:
+            return await _fetch_series(series_id, request)
+
+    results = await asyncio.gather(*(_one(sid) for sid in ids), return_exceptions=True)
+
+    out: dict[str, MonetaryPolicyDataResponse] = {}
+    for sid, result in zip(ids, results):
+        if isinstance(result, BaseException):
+            if not isinstance(result, Exception):
+                raise result
+            logger.error(f"Failed to fetch series '{sid}': {result!r}")
+            result = MonetaryPolicyDataResponse(external_id=sid, vintages=[])
+        out[sid] = result
+    return out
+
+
+async def enumerate_catalog(
+    policy_round: str | None = "latest",
+    limit: int = MAX_CONCURRENT_FETCHES,
+) -> list[tuple[SeriesInfo, MonetaryPolicyDataResponse]]:
+    """Pair every catalogued series with its forecasts, fetched concurrently.
+
+    Library helper for full‑catalogue scans (e.g. first/last observation
+    date per series).  At most *limit* requests are in flight; if one
+    fails the remaining fetches are cancelled and the error propagates.
+    Pass ``policy_round=None`` to load every vintage instead of the
+    latest round only.
+
+    Raises
+    ------
+    ValueError
+        If *limit* is less than 1.
+    """
+    if limit < 1:
+        raise ValueError(f"limit must be at least 1, got {limit}")
+    catalogue = await list_series_ids()
+    sem = asyncio.Semaphore(limit)
+
+    async def _one(info: SeriesInfo) -> MonetaryPolicyDataResponse:
+        async with sem:
+            return await get_policy_data(info.id, policy_round)
+
+    async with asyncio.TaskGroup() as tg:
+        tasks = [tg.create_task(_one(info)) for info in catalogue.series]
+    return [(info, t.result()) for info, t in zip(catalogue.series, tasks)]
+
+
+def clear_forecast_cache() -> None:
+    """Forget cached API payloads and parsed forecasts and catalogues."""
+    clear_cache()
+    _parsed_forecasts.clear()
+    _build_policy_rounds.cache_clear()
+    _build_series_info.cache_clear()
+
+
 # =============================================================================
 # ──────────────────────────── Thematic wrappers ──────────────────────────────
 # =============================================================================
@@ -306,7 +681,7 @@ async def get_gdp_data(
     • Because Statistics Sweden publishes these numbers first, they are the
     benchmark for **real‑time forecast evaluation**.
     """
-    return await _fetch_series("SEQGDPNAYCA", req)
+    return await _fetch_series(GDP_SERIES_ID, req)
 
 
 async def get_unemployment_data(
@@ -327,7 +702,7 @@ async def get_unemployment_data(
     • Set `"include_realized": true` to append realised (out‑turn) values.
     • For final historical data, pass `policy_round="latest"`.
     """
-    return await _fetch_series("SEQLABUEASA", req)
+    return await _fetch_series(UNEMPLOYMENT_SERIES_ID, req)
 
 
 async def get_cpi_data(
@@ -349,7 +724,7 @@ async def get_cpi_data(
 
     Reference rate for **wage and rent indexation clauses** in Sweden.
     """
-    return await _fetch_series("SEMCPINAYNA", req)
+    return await _fetch_series(CPI_SERIES_ID, req)
 
 
 async def get_cpif_data(
@@ -374,7 +749,7 @@ async def get_cpif_data(
     • Set `"include_realized": true` to append realised (out‑turn) values.
     • For final historical data, pass `policy_round="latest"`.
     """
-    return await _fetch_series("SEMCPIFNAYNA", req)
+    return await _fetch_series(CPIF_SERIES_ID, req)
 
 
 async def get_cpif_ex_energy_data(
@@ -398,7 +773,7 @@ async def get_cpif_ex_energy_data(
     • Set `"include_realized": true` to append realised (out‑turn) values.
     • For final historical data, pass `policy_round="latest"`.
     """
-    return await _fetch_series("SEMCPIFFEXYNA", req)
+    return await _fetch_series(CPIF_EX_ENERGY_SERIES_ID, req)
 
 
 async def get_hourly_labour_cost_data(
@@ -420,7 +795,7 @@ async def get_hourly_labour_cost_data(
 
     Key ingredient in **unit‑labour‑cost (ULC)** calculations: combine with GDP per hour to diagnose competitiveness.
     """
-    return await _fetch_series("SEACOMNAYCA", req)
+    return await _fetch_series(HOURLY_LABOUR_COST_SERIES_ID, req)
 
 
 async def get_hourly_wage_na_data(
@@ -443,7 +818,7 @@ async def get_hourly_wage_na_data(
 
     Evaluate **labour‑share dynamics**: pair with GDP at factor cost to see if wage income keeps up with productivity.
     """
-    return await _fetch_series("SEAWAGNAYCA", req)
+    return await _fetch_series(HOURLY_WAGE_NA_SERIES_ID, req)
 
 
 async def get_hourly_wage_nmo_data(
@@ -467,7 +842,7 @@ async def get_hourly_wage_nmo_data(
     sample carefully in microdata studies.
     """
 
-    return await _fetch_series("SEAWAGKLYNA", req)
+    return await _fetch_series(HOURLY_WAGE_NMO_SERIES_ID, req)
 
 
 async def get_population_data(
@@ -488,7 +863,7 @@ async def get_population_data(
     Measured in *thousands of persons*.  Combine with GDP for per‑capita
     analyses.
     """
-    return await _fetch_series("SEPOPYRCA", req)
+    return await _fetch_series(POPULATION_SERIES_ID, req)
 
 
 async def get_employed_persons_data(
@@ -509,7 +884,7 @@ async def get_employed_persons_data(
     • For final historical data, pass `policy_round="latest"`.
     """
 
-    return await _fetch_series("SEQLABEPASA", req)
+    return await _fetch_series(EMPLOYED_PERSONS_SERIES_ID, req)
 
 
 async def get_labour_force_data(
@@ -532,7 +907,7 @@ async def get_labour_force_data(
     Denominator for **participation‑rate** calculations: employment / labour force.
     Seasonal adjustment makes the series smoother than the raw LFS count.
     """
-    return await _fetch_series("SEQLABLFASA", req)
+    return await _fetch_series(LABOUR_FORCE_SERIES_ID, req)
 
 
 async def get_gdp_gap_data(
@@ -557,7 +932,7 @@ async def get_gdp_gap_data(
     assumptions; results can differ from other estimates (e.g. OECD).
     """
 
-    return await _fetch_series("SEQGDPGAPYSA", req)
+    return await _fetch_series(GDP_GAP_SERIES_ID, req)
 
 
 async def get_policy_rate_data(
@@ -584,7 +959,7 @@ async def get_policy_rate_data(
 
 
     """
-    return await _fetch_series("SEQRATENAYNA", req)
+    return await _fetch_series(POLICY_RATE_SERIES_ID, req)
 
 
 async def get_general_government_net_lending_data(
@@ -605,7 +980,7 @@ async def get_general_government_net_lending_data(
 
     Series ID: ``SEAPBSNAYNA``.
     """
-    return await _fetch_series("SEAPBSNAYNA", req)
+    return await _fetch_series(GENERAL_GOVERNMENT_NET_LENDING_SERIES_ID, req)
 
 
 # ──────────────── GDP level variants (calendar / seasonal adj.) ───────────────
@@ -640,7 +1015,7 @@ async def get_gdp_level_saca_data(
     quarters are directly comparable; Q‑on‑Q growth rates capture genuine
     economic changes rather than calendar artefacts.
     """
-    return await _fetch_series("SEQGDPNAASA", req)
+    return await _fetch_series(GDP_LEVEL_SACA_SERIES_ID, req)
 
 
 async def get_gdp_level_ca_data(
@@ -671,7 +1046,7 @@ async def get_gdp_level_ca_data(
       Q2 vs Q2) is meaningful, but quarter‑to‑quarter movements still follow
       the familiar seasonal rhythm.
     """
-    return await _fetch_series("SEQGDPNAACA", req)
+    return await _fetch_series(GDP_LEVEL_CA_SERIES_ID, req)
 
 
 async def get_gdp_level_na_data(
@@ -688,7 +1063,7 @@ async def get_gdp_level_na_data(
     • Nothing – this is the raw series at constant prices. It still contains
       both seasonal swings *and* calendar effects.
     """
-    return await _fetch_series("SEQGDPNAANA", req)
+    return await _fetch_series(GDP_LEVEL_NA_SERIES_ID, req)
 
 
 async def get_gdp_yoy_sa_data(
@@ -718,7 +1093,7 @@ async def get_gdp_yoy_sa_data(
     If you care about the precise wording used by Statistics Sweden on
     release day, use :func:`get_gdp_data` instead (calendar‑adjusted only).
     """
-    return await _fetch_series("SEQGDPNAYSA", req)
+    return await _fetch_series(GDP_YOY_SA_SERIES_ID, req)
 
 
 async def get_gdp_yoy_na_data(
@@ -737,7 +1112,7 @@ async def get_gdp_yoy_na_data(
 
     Series ID: ``SEQGDPNAYNA``.
     """
-    return await _fetch_series("SEQGDPNAYNA", req)
+    return await _fetch_series(GDP_YOY_NA_SERIES_ID, req)
 
 
 # ─────────────────────────────── CPI level/changes ───────────────────────────
@@ -758,7 +1133,7 @@ async def get_cpi_index_data(
 
     Series ID: ``SEMCPINAANA``.
     """
-    return await _fetch_series("SEMCPINAANA", req)
+    return await _fetch_series(CPI_INDEX_SERIES_ID, req)
 
 
 async def get_cpi_yoy_data(
@@ -776,7 +1151,7 @@ async def get_cpi_yoy_data(
 
     Series ID: ``SEMCPINAYNA``.
     """
-    return await _fetch_series("SEMCPINAYNA", req)
+    return await _fetch_series(CPI_SERIES_ID, req)
 
 
 # ─────────────────────────────── CPIF variants ───────────────────────────────
@@ -798,7 +1173,7 @@ async def get_cpif_yoy_data(
 
     Series ID: ``SEMCPIFNAYNA``.
     """
-    return await _fetch_series("SEMCPIFNAYNA", req)
+    return await _fetch_series(CPIF_SERIES_ID, req)
 
 
 async def get_cpif_ex_energy_index_data(
@@ -825,7 +1200,7 @@ async def get_cpif_ex_energy_index_data(
       household income with this index rather than headline CPI, thereby
       filtering out energy price noise.
     """
-    return await _fetch_series("SEMCPIFFEXANA", req)
+    return await _fetch_series(CPIF_EX_ENERGY_INDEX_SERIES_ID, req)
 
 
 # ─────────────── Nominal exchange rate (KIX) – index level ───────────────────
@@ -856,7 +1231,7 @@ async def get_nominal_exchange_rate_kix_index_data(
 
     Remember: A **higher** KIX value means a **weaker** krona.
     """
-    return await _fetch_series("SEQKIXNAANA", req)
+    return await _fetch_series(KIX_INDEX_SERIES_ID, req)
 
 
 # ────────────────────────────── Demographics ─────────────────────────────────
@@ -880,4 +1255,4 @@ async def get_population_level_data(
     • For final historical data, pass `policy_round="latest"`.
 
     """
-    return await _fetch_series("SEQPOPNAANA", req)
+    return await _fetch_series(POPULATION_LEVEL_SERIES_ID, req)
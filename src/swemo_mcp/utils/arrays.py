@@ -0,0 +1,109 @@
+"""
+Column‑oriented (NumPy) views of forecast vintages.
+
+Requires the optional ``arrays`` extra (``pip install swemo-mcp[arrays]``).
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Literal
+
+import numpy as np
+from pydantic import BaseModel, ConfigDict
+
+from swemo_mcp.models import ForecastVintage, observation_date_key
+
+logger = logging.getLogger(__name__)
+
+ValueDType = Literal["float64", "float32"]
+
+
+class ForecastArray(BaseModel):
+    """
+    A forecast vintage stored column‑wise: one array per field instead of
+    one object per observation.  Missing forecast/observation values are NaN.
+    Instances come from the builders below, which fill the columns directly.
+    """
+
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
+
+    dates: np.ndarray
+    values: np.ndarray
+    forecast: np.ndarray
+    observation: np.ndarray
+
+
+def vintage_to_array(
+    vintage: ForecastVintage, dtype: ValueDType = "float64"
+) -> ForecastArray:
+    """
+    Convert the observations of *vintage* into a :class:`ForecastArray`.
+
+    ``dtype="float32"`` halves the memory of the value columns.  Riksbank
+    rates and growth figures carry a handful of decimals and fit easily,
+    but large levels (e.g. GDP in million SEK) lose precision below the
+    unit – keep the ``float64`` default for those.
+    """
+    obs = vintage.observations
+    n = len(obs)
+    nan = float("nan")
+    return ForecastArray.model_construct(
+        dates=np.array([o.dt for o in obs], dtype="datetime64[D]"),
+        values=np.fromiter((o.value for o in obs), dtype=dtype, count=n),
+        forecast=np.fromiter(
+            (nan if o.forecast is None else o.forecast for o in obs),
+            dtype=dtype,
+            count=n,
+        ),
+        observation=np.fromiter(
+            (nan if o.observation is None else o.observation for o in obs),
+            dtype=dtype,
+            count=n,
+        ),
+    )
+
+
+def payload_to_arrays(
+    payload: dict[str, Any], dtype: ValueDType = "float64"
+) -> list[ForecastArray]:
+    """
+    Convert a raw forecasts payload into one :class:`ForecastArray` per
+    vintage, without building per‑row Pydantic objects.
+
+    The forecast/outcome split is a single vectorised comparison of the
+    date column against the vintage's cut‑off date.  Unlike the model path,
+    an unparseable observation date raises ``ValueError``.
+    """
+    items: list[dict[str, Any]] = payload.get("data", []) or []
+    if not items:
+        return []
+    raw_vintages = items[0].get("vintages", [])
+    if isinstance(raw_vintages, dict):
+        raw_vintages = [raw_vintages]
+    return [_raw_vintage_to_array(v, dtype) for v in raw_vintages]
+
+
+def _raw_vintage_to_array(vintage: dict[str, Any], dtype: ValueDType) -> ForecastArray:
+    raw_obs: list[dict[str, Any]] = vintage.get("observations", [])
+    n = len(raw_obs)
+    date_key = observation_date_key(raw_obs)
+
+    dates = np.array([o[date_key] for o in raw_obs], dtype="datetime64[D]")
+    values = np.fromiter((o["value"] for o in raw_obs), dtype=dtype, count=n)
+
+    is_fc = np.zeros(n, dtype=bool)
+    cutoff = vintage.get("metadata", {}).get("forecast_cutoff_date")
+    if cutoff:
+        try:
+            is_fc = dates > np.datetime64(cutoff, "D")
+        except ValueError:
+            logger.warning(f"Malformed cutoff date '{cutoff}' in vintage.")
+
+    nan = np.array(np.nan, dtype=dtype)
+    return ForecastArray.model_construct(
+        dates=dates,
+        values=values,
+        forecast=np.where(is_fc, values, nan),
+        observation=np.where(is_fc, nan, values),
+    )
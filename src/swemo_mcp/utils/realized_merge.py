@@ -27,20 +27,20 @@ def merge_realized(base: ForecastVintage, latest: ForecastVintage) -> ForecastVi
         if (o.observation is not None) and (date.fromisoformat(o.dt) > cut)
     }
 
-    enriched: list[ForecastObservation] = []
-    for o in base.observations:
-        # If it's a forecast and a realised value exists, fill it
-        obs_val = obs_map.get(o.dt) if o.forecast is not None else o.value
-        enriched.append(
-            ForecastObservation.model_validate(
-                {
-                    "dt": o.dt,
-                    "value": o.value,
-                    "forecast": o.forecast,
-                    "observation": obs_val,
-                }
-            )
+    # If it's a forecast and a realised value exists, fill it
+    enriched = [
+        ForecastObservation.model_validate(
+            {
+                "dt": o.dt,
+                "value": o.value,
+                "forecast": o.forecast,
+                "observation": (
+                    obs_map.get(o.dt) if o.forecast is not None else o.value
+                ),
+            }
         )
+        for o in base.observations
+    ]
 
     # Add observational rows missing from base
     base_dates = {o.dt for o in base.observations}
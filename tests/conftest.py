@@ -0,0 +1,45 @@
+"""
+Shared fixtures: an isolated request cache and a mock Riksbank API.
+"""
+
+from collections.abc import Awaitable, Callable, Iterator
+from pathlib import Path
+
+import httpx
+import pytest
+
+from swemo_mcp.services import _http
+from swemo_mcp.services import monetary_policy_api as api
+from swemo_mcp.tools.monetary_policy_tools import clear_forecast_cache
+
+# Handlers may be async, e.g. to hold requests in flight
+Handler = Callable[[httpx.Request], httpx.Response | Awaitable[httpx.Response]]
+Serve = Callable[[Handler], list[httpx.Request]]
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path) -> Iterator[None]:
+    monkeypatch.setattr(_http, "CACHE_DIR", tmp_path)
+    clear_forecast_cache()
+    yield
+    clear_forecast_cache()
+
+
+@pytest.fixture
+def serve(monkeypatch: pytest.MonkeyPatch) -> Serve:
+    """Route API requests to *handler*; returns the list of requests seen."""
+
+    def install(handler: Handler) -> list[httpx.Request]:
+        seen: list[httpx.Request] = []
+
+        def record(
+            request: httpx.Request,
+        ) -> httpx.Response | Awaitable[httpx.Response]:
+            seen.append(request)
+            return handler(request)
+
+        client = httpx.AsyncClient(transport=httpx.MockTransport(record))
+        monkeypatch.setattr(api, "get_client", lambda: client)
+        return seen
+
+    return install
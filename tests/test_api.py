@@ -0,0 +1,36 @@
+"""
+Tests for the request helpers in ``swemo_mcp.services.monetary_policy_api``.
+"""
+
+import httpx
+import pytest
+
+from swemo_mcp.services import monetary_policy_api as api
+
+
+def too_many_requests(retry_after: str | None) -> httpx.Response:
+    headers = {"Retry-After": retry_after} if retry_after is not None else {}
+    return httpx.Response(429, headers=headers)
+
+
+@pytest.mark.parametrize(
+    ("retry_after", "expected"),
+    [
+        ("5", 5.0),
+        ("0.5", 0.5),
+        ("3600", api.MAX_RETRY_AFTER),
+        ("-3", 0.0),
+    ],
+)
+def test_retry_after_honours_seconds_within_bounds(
+    retry_after: str, expected: float
+) -> None:
+    assert api._retry_after(too_many_requests(retry_after), default=2.0) == expected
+
+
+@pytest.mark.parametrize(
+    "retry_after",
+    [None, "Wed, 21 Oct 2026 07:28:00 GMT", "inf", "-inf", "nan", ""],
+)
+def test_retry_after_falls_back_to_default(retry_after: str | None) -> None:
+    assert api._retry_after(too_many_requests(retry_after), default=2.0) == 2.0
@@ -0,0 +1,65 @@
+"""
+Tests for the column-oriented views in ``swemo_mcp.utils.arrays``.
+"""
+
+from typing import Any
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from swemo_mcp.tools.monetary_policy_tools import _parse_policy_data  # noqa: E402
+from swemo_mcp.utils.arrays import payload_to_arrays, vintage_to_array  # noqa: E402
+
+
+def payload(date_key: str, cutoff: str | None) -> dict[str, Any]:
+    obs = [
+        {date_key: "2023-12-31", "value": 1.5},
+        {date_key: "2024-01-15", "value": 2.0},
+        {date_key: "2024-01-16", "value": 2.5},
+        {date_key: "2024-06-30", "value": 3.0},
+    ]
+    metadata = {
+        "forecast_cutoff_date": cutoff,
+        "policy_round": "2024:1",
+        "policy_round_end_dtm": "2024-02-01T09:30:00Z",
+    }
+    return {
+        "data": [
+            {
+                "external_id": "X",
+                "vintages": [{"metadata": metadata, "observations": obs}],
+            }
+        ]
+    }
+
+
+@pytest.mark.parametrize("date_key", ["dt", "date"])
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_model_and_raw_paths_agree(date_key: str, dtype: Any) -> None:
+    raw = payload(date_key, "2024-01-15")
+    vintage = _parse_policy_data("X", raw).vintages[0]
+
+    from_model = vintage_to_array(vintage, dtype)
+    [from_raw] = payload_to_arrays(raw, dtype)
+
+    for column in ("dates", "values", "forecast", "observation"):
+        np.testing.assert_array_equal(
+            getattr(from_model, column), getattr(from_raw, column)
+        )
+        assert getattr(from_model, column).dtype == getattr(from_raw, column).dtype
+    # Rows after the cut-off are forecasts, the rest outcomes
+    np.testing.assert_array_equal(
+        np.isnan(from_raw.forecast), [True, True, False, False]
+    )
+    np.testing.assert_array_equal(
+        np.isnan(from_raw.observation), [False, False, True, True]
+    )
+
+
+@pytest.mark.parametrize("cutoff", [None, "not-a-date"])
+def test_raw_path_without_usable_cutoff_gives_all_outcomes(cutoff: str | None) -> None:
+    [arrays] = payload_to_arrays(payload("dt", cutoff))
+
+    assert np.isnan(arrays.forecast).all()
+    np.testing.assert_array_equal(arrays.observation, arrays.values)
@@ -0,0 +1,95 @@
+"""
+Tests for the TTL / ETag / disk request cache in ``swemo_mcp.services._http``.
+"""
+
+import asyncio
+from collections.abc import Callable
+from pathlib import Path
+
+import httpx
+import pytest
+
+from swemo_mcp.services import _http
+from swemo_mcp.services import monetary_policy_api as api
+
+Handler = Callable[[httpx.Request], httpx.Response]
+Serve = Callable[[Handler], list[httpx.Request]]
+
+
+def _expire_all() -> None:
+    for key, (_, payload, etag) in list(_http._cache.items()):
+        _http._cache[key] = (0.0, payload, etag)
+
+
+@pytest.mark.asyncio
+async def test_hit_skips_the_network(serve: Serve) -> None:
+    seen = serve(lambda r: httpx.Response(200, json={"data": ["2024:1"]}))
+
+    first = await api.riksbanken_request("policy_rounds", ttl=60)
+    second = await api.riksbanken_request("policy_rounds", ttl=60)
+
+    assert first == {"data": ["2024:1"]}
+    assert second is first
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_collapse_into_one_request(serve: Serve) -> None:
+    seen = serve(lambda r: httpx.Response(200, json={"data": ["2024:1"]}))
+
+    results = await asyncio.gather(
+        *(api.riksbanken_request("policy_rounds", ttl=60) for _ in range(5))
+    )
+
+    assert len(seen) == 1
+    assert all(r is results[0] for r in results)
+    assert _http._locks == {}
+
+
+@pytest.mark.asyncio
+async def test_expired_entry_is_revalidated_with_etag(serve: Serve) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304)
+        return httpx.Response(200, json={"data": ["2024:1"]}, headers={"ETag": '"v1"'})
+
+    seen = serve(handler)
+
+    first = await api.riksbanken_request("policy_rounds", ttl=60)
+    _expire_all()
+    second = await api.riksbanken_request("policy_rounds", ttl=60)
+
+    assert [r.headers.get("If-None-Match") for r in seen] == [None, '"v1"']
+    assert second is first
+
+
+@pytest.mark.asyncio
+async def test_persisted_payload_is_read_back_after_restart(
+    serve: Serve, tmp_path: Path
+) -> None:
+    params = {"series": "SEQGDPNAYCA", "policy_round_name": "2024:1"}
+    payload = {"data": [{"external_id": "SEQGDPNAYCA", "vintages": []}]}
+    seen = serve(lambda r: httpx.Response(200, json=payload))
+
+    await api.riksbanken_request("", params, ttl=60, persist=True)
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+    _http.clear_cache()  # memory only, as after a restart
+    assert await api.riksbanken_request("", params, ttl=60, persist=True) == payload
+    assert len(seen) == 1
+
+
+@pytest.mark.asyncio
+async def test_empty_payload_is_never_persisted(serve: Serve, tmp_path: Path) -> None:
+    params = {"series": "SEQGDPNAYCA", "policy_round_name": "2099:1"}
+    seen = serve(lambda r: httpx.Response(200, json={"data": []}))
+
+    await api.riksbanken_request("", params, ttl=60, persist=True)
+    assert list(tmp_path.glob("*.json")) == []
+
+    # An empty entry left on disk by an older version is ignored as well
+    key = _http.cache_key(api.BASE_URL, "", params)
+    _http._disk_path(key).write_bytes(b'{"data": []}')
+    _http.clear_cache()
+    await api.riksbanken_request("", params, ttl=60, persist=True)
+    assert len(seen) == 2
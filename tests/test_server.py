@@ -0,0 +1,39 @@
+"""
+Tests for tool registration in ``swemo_mcp.server``.
+"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+import httpx
+import pytest
+
+from swemo_mcp.server import _TOOLS, app_lifespan, mcp
+
+Handler = Callable[[httpx.Request], httpx.Response | Awaitable[httpx.Response]]
+Serve = Callable[[Handler], list[httpx.Request]]
+
+
+@pytest.mark.asyncio
+async def test_every_tool_is_registered_once() -> None:
+    names = [tool.name for tool in await mcp.list_tools()]
+
+    assert len(_TOOLS) == 28
+    assert len(names) == len(_TOOLS)
+    assert len(set(names)) == len(names)
+    assert set(names) == {fn.__name__ for fn in _TOOLS}
+
+
+@pytest.mark.asyncio
+async def test_lifespan_waits_for_the_cancelled_warm_up(serve: Serve) -> None:
+    async def hang(request: httpx.Request) -> httpx.Response:
+        await asyncio.Event().wait()
+        raise AssertionError("unreachable")
+
+    seen = serve(hang)
+
+    async with app_lifespan(mcp):
+        while not seen:
+            await asyncio.sleep(0)
+
+    assert asyncio.all_tasks() == {asyncio.current_task()}
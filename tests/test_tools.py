@@ -0,0 +1,318 @@
+"""
+Tests for the forecast helpers in ``swemo_mcp.tools.monetary_policy_tools``.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import date
+from pathlib import Path
+from typing import Any
+
+import httpx
+import pytest
+from pydantic import ValidationError
+
+from swemo_mcp.query import ForecastRequest
+from swemo_mcp.services import _http
+from swemo_mcp.tools import monetary_policy_tools as tools
+
+Handler = Callable[[httpx.Request], httpx.Response | Awaitable[httpx.Response]]
+Serve = Callable[[Handler], list[httpx.Request]]
+
+CUTOFF = "2024-01-15"
+
+
+def vintage(
+    observations: list[dict[str, Any]],
+    cutoff: str | None = CUTOFF,
+    policy_round: str = "2024:1",
+) -> dict[str, Any]:
+    return {
+        "metadata": {
+            "forecast_cutoff_date": cutoff,
+            "policy_round": policy_round,
+            "policy_round_end_dtm": "2024-02-01T09:30:00Z",
+        },
+        "observations": observations,
+    }
+
+
+def forecasts(series_id: str, *vintages: dict[str, Any]) -> dict[str, Any]:
+    return {"data": [{"external_id": series_id, "vintages": list(vintages)}]}
+
+
+def _expire_all() -> None:
+    for key, (_, payload, etag) in list(_http._cache.items()):
+        _http._cache[key] = (0.0, payload, etag)
+
+
+@pytest.mark.asyncio
+async def test_changed_payload_is_parsed_again(serve: Serve) -> None:
+    values = iter([1.0, 2.0])
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        obs = [{"dt": "2024-01-01", "value": next(values)}]
+        return httpx.Response(200, json=forecasts("SEQGDPNAYCA", vintage(obs)))
+
+    serve(handler)
+
+    first = await tools.get_policy_data("SEQGDPNAYCA")
+    assert await tools.get_policy_data("SEQGDPNAYCA") is first
+
+    _expire_all()
+    second = await tools.get_policy_data("SEQGDPNAYCA")
+    assert second.vintages[0].observations[0].value == 2.0
+
+
+@pytest.mark.asyncio
+async def test_parsed_forecasts_are_bounded(
+    serve: Serve, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tools, "MAX_PARSED_FORECASTS", 2)
+    serve(lambda r: httpx.Response(200, json=forecasts("X", vintage([]))))
+
+    for series_id in ("A", "B", "C"):
+        await tools.get_policy_data(series_id)
+
+    assert [key[0] for key in tools._parsed_forecasts] == ["B", "C"]
+
+
+@pytest.mark.asyncio
+async def test_clear_forecast_cache_empties_both_layers(serve: Serve) -> None:
+    serve(lambda r: httpx.Response(200, json=forecasts("X", vintage([]))))
+    await tools.get_policy_data("SEQGDPNAYCA")
+    assert _http._cache and tools._parsed_forecasts
+
+    tools.clear_forecast_cache()
+
+    assert not _http._cache
+    assert not tools._parsed_forecasts
+
+
+DATES = [
+    "2023-12-31",
+    "2024-01-14",
+    "2024-01-15",
+    "2024-01-16",
+    "2024-02-01",
+    "2025-01-01",
+]
+
+
+def test_cutoff_split_matches_parsed_dates() -> None:
+    obs = [{"dt": d, "value": 1.0} for d in DATES]
+    response = tools._parse_policy_data("X", forecasts("X", vintage(obs)))
+
+    cutoff = date.fromisoformat(CUTOFF)
+    expected = [date.fromisoformat(d) > cutoff for d in DATES]
+    rows = response.vintages[0].observations
+    assert [row.forecast is not None for row in rows] == expected
+    assert [row.observation is None for row in rows] == expected
+
+
+@pytest.mark.parametrize("cutoff", [None, ""])
+def test_missing_cutoff_gives_all_outcomes(cutoff: str | None) -> None:
+    obs = [{"dt": d, "value": 1.0} for d in DATES]
+    rows = tools._build_observations(obs, tools._cutoff_iso(cutoff), {}.setdefault)
+
+    assert all(row.forecast is None and row.observation == 1.0 for row in rows)
+
+
+def test_malformed_cutoff_is_logged_and_gives_all_outcomes(
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    obs = [{"dt": d, "value": 1.0} for d in DATES]
+    with caplog.at_level(logging.WARNING):
+        cutoff_iso = tools._cutoff_iso("2024-13-01")
+    rows = tools._build_observations(obs, cutoff_iso, {}.setdefault)
+
+    assert "Malformed cutoff date '2024-13-01'" in caplog.text
+    assert all(row.forecast is None and row.observation == 1.0 for row in rows)
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_trusted_and_validated_paths_agree(
+    trusted: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    obs = [
+        {"dt": "2024-01-01", "value": 1.5},
+        {"dt": "2024-01-02", "value": 2},
+        {"dt": "2024-02-01", "value": 3.0},
+        {"dt": "2024-03-01", "value": 4},
+    ]
+    payload = forecasts("X", vintage(obs))
+    expected = tools._parse_policy_data("X", payload).model_dump()
+
+    monkeypatch.setattr(tools, "_TRUST_API", trusted)
+    response = tools._parse_policy_data("X", payload)
+
+    assert response.model_dump() == expected
+    rows = response.vintages[0].observations
+    assert [type(row.value) for row in rows] == [float] * 4
+    assert [type(row.observation) for row in rows[:2]] == [float] * 2
+    assert [type(row.forecast) for row in rows[2:]] == [float] * 2
+
+    rounds = tools._build_policy_rounds(("2024:1", "2024:2"), trusted)
+    assert rounds.model_dump() == {
+        "rounds": [
+            {"id": "2024:1", "year": 2024, "iteration": 1},
+            {"id": "2024:2", "year": 2024, "iteration": 2},
+        ]
+    }
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_missing_metadata_raises_on_both_paths(
+    trusted: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tools, "_TRUST_API", trusted)
+    payload = forecasts("X", {"observations": [{"dt": "2024-01-01", "value": 1.0}]})
+
+    with pytest.raises(ValidationError):
+        tools._parse_policy_data("X", payload)
+
+
+def riksbank(request: httpx.Request) -> httpx.Response:
+    """Serve a two-round catalogue and one outcome per forecast series."""
+    if request.url.path.endswith("/policy_rounds"):
+        return httpx.Response(200, json={"data": ["2024:1", "2024:2"]})
+    series_id = request.url.params["series"]
+    obs = [{"dt": "2024-01-01", "value": 1.0}]
+    return httpx.Response(200, json=forecasts(series_id, vintage(obs)))
+
+
+@pytest.mark.asyncio
+async def test_get_forecasts_defaults_to_the_headline_panel(serve: Serve) -> None:
+    seen = serve(riksbank)
+
+    panel = await tools.get_forecasts()
+
+    assert list(panel) == list(tools._DEFAULT_SERIES)
+    assert {r.url.params["series"] for r in seen} == set(tools._DEFAULT_SERIES)
+    assert all(response.vintages for response in panel.values())
+
+
+@pytest.mark.asyncio
+async def test_get_forecasts_turns_failures_into_empty_vintages(
+    serve: Serve, caplog: pytest.LogCaptureFixture
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("series") == "BROKEN":
+            return httpx.Response(500)
+        return riksbank(request)
+
+    serve(handler)
+
+    panel = await tools.get_forecasts(["SEQGDPNAYCA", "BROKEN"])
+
+    assert panel["SEQGDPNAYCA"].vintages
+    assert panel["BROKEN"].external_id == "BROKEN"
+    assert panel["BROKEN"].vintages == []
+    assert "Failed to fetch series 'BROKEN'" in caplog.text
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("include_realized", [False, True])
+async def test_get_forecasts_keeps_requests_within_the_pool(
+    serve: Serve, include_realized: bool
+) -> None:
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        if "series" in request.url.params:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+        return riksbank(request)
+
+    seen = serve(handler)
+    series_ids = [f"S{i}" for i in range(2 * tools.MAX_CONCURRENT_FETCHES)]
+    req = ForecastRequest(policy_round=None, include_realized=include_realized)
+
+    await tools.get_forecasts(series_ids, req)
+
+    per_series = 2 if include_realized else 1
+    assert sum("series" in r.url.params for r in seen) == len(series_ids) * per_series
+    assert peak == tools.MAX_CONCURRENT_FETCHES
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -1])
+async def test_enumerate_catalog_rejects_limit_below_one(
+    serve: Serve, limit: int
+) -> None:
+    seen = serve(riksbank)
+
+    with pytest.raises(ValueError, match="limit must be at least 1"):
+        await tools.enumerate_catalog(limit=limit)
+    assert seen == []
+
+
+@pytest.mark.asyncio
+async def test_is_closed_round(serve: Serve) -> None:
+    serve(riksbank)
+
+    assert await tools._is_closed_round("2024:1")
+    assert not await tools._is_closed_round("2024:2")  # latest, still open
+    assert not await tools._is_closed_round("2099:1")  # unknown
+
+
+@pytest.mark.asyncio
+async def test_only_closed_rounds_are_persisted(serve: Serve, tmp_path: Path) -> None:
+    serve(riksbank)
+
+    for policy_round in ("2024:2", "2099:1", None):
+        await tools.get_policy_data("SEQGDPNAYCA", policy_round)
+    assert list(tmp_path.glob("*.json")) == []
+
+    await tools.get_policy_data("SEQGDPNAYCA", "2024:1")
+    assert len(list(tmp_path.glob("*.json"))) == 1
+
+
+@pytest.mark.asyncio
+async def test_nothing_is_persisted_without_the_catalogue(
+    serve: Serve, tmp_path: Path, caplog: pytest.LogCaptureFixture
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/policy_rounds"):
+            return httpx.Response(500)
+        return riksbank(request)
+
+    serve(handler)
+
+    response = await tools.get_policy_data("SEQGDPNAYCA", "2024:1")
+
+    assert response.vintages
+    assert list(tmp_path.glob("*.json")) == []
+    assert "Policy round catalogue unavailable" in caplog.text
+
+
+@pytest.mark.asyncio
+async def test_closed_round_without_data_is_not_persisted(
+    serve: Serve, tmp_path: Path
+) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path.endswith("/policy_rounds"):
+            return riksbank(request)
+        return httpx.Response(200, json={"data": []})
+
+    serve(handler)
+
+    response = await tools.get_policy_data("SEQGDPNAYCA", "2024:1")
+
+    assert response.vintages == []
+    assert list(tmp_path.glob("*.json")) == []
+
+
+@pytest.mark.parametrize("trusted", [True, False])
+def test_numeric_strings_are_rejected(
+    trusted: bool, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    monkeypatch.setattr(tools, "_TRUST_API", trusted)
+    payload = forecasts("X", vintage([{"dt": "2024-01-01", "value": "1.5"}]))
+
+    with pytest.raises(ValidationError):
+        tools._parse_policy_data("X", payload)